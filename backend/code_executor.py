@@ -16,6 +16,7 @@ Responsibilities:
 import ast
 import pickle
 import re
+import string
 from typing import Any, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 from datetime import datetime
@@ -28,6 +29,34 @@ from notebook_manager import NotebookManager
 from dependency_analyzer import DependencyAnalyzer
 
 
+# Markdown written after each successful node execution (see _generate_execution_markdown)
+_EXECUTION_MARKDOWN_TEMPLATE = string.Template(
+    "## ✓ Execution Complete: $name\n\n"
+    "**Completed at:** $completed\n\n"
+    "**Execution time:** ${duration}s\n\n"
+    "**Status:** ✅ Success\n\n"
+    "### Execution Output\n\n"
+    "$output\n\n"
+    "---\n\n"
+    "_Note: This documentation is auto-generated. For detailed AI-powered summaries, "
+    "please enable summary generation in node settings._"
+)
+
+# (result_format, is_dict_result) -> result_path template relative to the project
+_RESULT_PATH_TEMPLATES = {
+    ('parquet', True): "{target_dir}/{node_id}",
+    ('parquet', False): "{target_dir}/{node_id}.parquet",
+    ('json', True): "{target_dir}/results/{node_id}_dict.json",
+    ('json', False): "{target_dir}/{node_id}.json",
+    ('image', True): "{target_dir}/{node_id}.png",
+    ('image', False): "{target_dir}/{node_id}.png",
+    ('visualization', True): "{target_dir}/{node_id}.png",
+    ('visualization', False): "{target_dir}/{node_id}.png",
+    ('pkl', True): "{target_dir}/{node_id}.pkl",
+    ('pkl', False): "{target_dir}/{node_id}.pkl",
+}
+
+
 class CodeValidator:
     """Validates code and extracts information"""
 
@@ -1589,66 +1618,31 @@ with open(r'{full_path}', 'rb') as f:
                 target_dir = 'visualizations' if is_visualization else 'parquets'
 
                 # Check if result is a dict of DataFrames
-                # First check declared_output_type, then check actual file structure
-                from pathlib import Path
-
-                # Priority 1: Initialize is_dict_result and auto-detect flag
-                is_dict_result = False
-                need_auto_detect = False
-
-                # Priority 2: Check declared output type STRICTLY
                 # If declared, we trust the declaration and don't auto-detect from file structure
-                if declared_output_type == 'dict_of_dataframes':
-                    # User explicitly declared this returns dict
-                    is_dict_result = True
-                    print(f"[Execution] ✓ Using declared output type: dict_of_dataframes")
-                elif declared_output_type:
-                    # Other declared types mean it's NOT a dict
-                    is_dict_result = False
+                if declared_output_type:
+                    is_dict_result = declared_output_type == 'dict_of_dataframes'
                     print(f"[Execution] ✓ Using declared output type: {declared_output_type}")
-                    # Don't auto-detect from file structure when type is explicitly declared
-                else:
-                    # No declaration - need to auto-detect from file structure
-                    need_auto_detect = True
-
-                # Priority 3: Auto-detect from file structure ONLY if not declared
-                if need_auto_detect:
-                    if result_format == 'parquet':
-                        # For parquet format, check if directory with metadata exists
-                        parquets_path = Path(self.pm.parquets_path)
-                        node_dir = parquets_path / node_id
-                        if node_dir.is_dir() and (node_dir / '_metadata.json').exists():
-                            is_dict_result = True
-                            print(f"[Execution] ✓ Detected dict of DataFrames result - saved as directory")
-                        # else: is_dict_result remains False
-                    else:
-                        # For other formats (json, etc.), check for dict indicators
-                        if result_format == 'json':
-                            # Also check for dict saved as JSON
-                            results_dir = Path(self.pm.parquets_path) / 'results'
-                            dict_path = results_dir / f'{node_id}_dict.json'
-                            if dict_path.exists():
-                                is_dict_result = True
-                                print(f"[Execution] ✓ Detected dict result saved as JSON")
-                            # else: is_dict_result remains False
-
-                # Set result_path based on is_dict_result flag
-                if result_format == 'parquet':
+                elif result_format == 'parquet':
+                    # No declaration: a dict of DataFrames is saved as a directory with metadata
+                    node_dir = Path(self.pm.parquets_path) / node_id
+                    is_dict_result = node_dir.is_dir() and (node_dir / '_metadata.json').exists()
                     if is_dict_result:
-                        result_path = f"{target_dir}/{node_id}"
-                    else:
-                        result_path = f"{target_dir}/{node_id}.parquet"
+                        print(f"[Execution] ✓ Detected dict of DataFrames result - saved as directory")
                 elif result_format == 'json':
+                    # No declaration: check for dict saved as JSON
+                    dict_path = Path(self.pm.parquets_path) / 'results' / f'{node_id}_dict.json'
+                    is_dict_result = dict_path.exists()
                     if is_dict_result:
-                        result_path = f"{target_dir}/results/{node_id}_dict.json"
-                    else:
-                        result_path = f"{target_dir}/{node_id}.json"
-                elif result_format in ['image', 'visualization']:
-                    result_path = f"{target_dir}/{node_id}.png"
-                elif result_format == 'pkl':
-                    result_path = f"{target_dir}/{node_id}.pkl"
-                else:
-                    result_path = f"{target_dir}/{node_id}.{result_format}"
+                        print(f"[Execution] ✓ Detected dict result saved as JSON")
+
+                # Set result_path based on result_format and is_dict_result flag
+                result_path_template = _RESULT_PATH_TEMPLATES.get(
+                    (result_format, is_dict_result),
+                    "{target_dir}/{node_id}.{result_format}"
+                )
+                result_path = result_path_template.format(
+                    target_dir=target_dir, node_id=node_id, result_format=result_format
+                )
 
             # Call unified metadata sync method (Step 8: Update node status)
             print(f"[Execution] Step 8: Updating node status...")
@@ -1897,39 +1891,22 @@ with open(r'{full_path}', 'rb') as f:
             completion_time = datetime.now().isoformat()
             node_name = node.get('name', node_id)
 
-            # Build markdown content with execution details
-            markdown_content = f"""## ✓ Execution Complete: {node_name}
-
-**Completed at:** {completion_time}
-
-**Execution time:** {execution_time:.2f}s
-
-**Status:** ✅ Success
-
-### Execution Output"""
-
-            # Add execution output if available
+            # Format execution output in a code block for better readability
             if execution_output:
                 output_text = execution_output.get('output', '')
                 if output_text and output_text.strip():
-                    # Format output in a code block for better readability
-                    markdown_content += f"""
-
-```
-{output_text}
-```"""
+                    output_block = f"```\n{output_text}\n```"
                 else:
-                    # If no output, add a note
-                    markdown_content += "\n\n_(No output generated)_"
+                    output_block = "_(No output generated)_"
             else:
-                markdown_content += "\n\n_(No output available)_"
-
-            # Add footer note
-            markdown_content += """
+                output_block = "_(No output available)_"
 
----
-
-_Note: This documentation is auto-generated. For detailed AI-powered summaries, please enable summary generation in node settings._"""
+            markdown_content = _EXECUTION_MARKDOWN_TEMPLATE.substitute(
+                name=node_name,
+                completed=completion_time,
+                duration=f"{execution_time:.2f}",
+                output=output_block
+            )
 
             # Find existing markdown cell linked to this node
             existing_cells = self.nm.find_markdown_cells_by_linked_node(node_id)
@@ -4,10 +4,26 @@ DAG Layout Algorithm for Automatic Node Positioning
 Implements hierarchical layout algorithm with special handling for tool nodes.
 """
 
+import functools
+from datetime import datetime
 from typing import Dict, List, Tuple, Set, Optional, Any
 from dataclasses import dataclass
 
 
+@functools.lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> float:
+    """
+    Parse an ISO timestamp to epoch seconds. Cached because nodes run in
+    the same batch often share a timestamp.
+
+    Unparseable times return inf so they sort after the parseable ones.
+    """
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return float('inf')
+
+
 @dataclass
 class NodeLayoutInfo:
     """Information about a node's position and layout"""
@@ -52,6 +68,7 @@ class DAGLayout:
         self.edges = edges
         self.adjacency_list = self._build_adjacency_list()
         self.reverse_adjacency = self._build_reverse_adjacency_list()
+        self.execution_time_keys = self._build_execution_time_keys()
 
     def _build_adjacency_list(self) -> Dict[str, List[str]]:
         """Build adjacency list from edges (parent -> children)"""
@@ -69,6 +86,20 @@ class DAGLayout:
                 graph[target].append(source)
         return graph
 
+    def _build_execution_time_keys(self) -> Dict[str, Tuple[bool, float]]:
+        """
+        Build the within-layer sort key of every node once, parsing each
+        first_execution_time a single time: (unexecuted, timestamp)
+        """
+        keys = {}
+        for node_id, node in self.nodes.items():
+            first_exec_time = node.get('first_execution_time')
+            if not first_exec_time:
+                keys[node_id] = (True, 0.0)
+                continue
+            keys[node_id] = (False, _parse_iso(first_exec_time))
+        return keys
+
     def calculate_layout(self) -> Dict[str, Tuple[float, float]]:
         """
         Calculate positions for all nodes
@@ -154,38 +185,42 @@ class DAGLayout:
 
     def _calculate_layers(self, node_ids: List[str]) -> Dict[str, int]:
         """
-        Calculate layer for each node using dynamic programming
+        Calculate layer for each node (longest path from a source) with an
+        iterative depth-first walk over parents, so long chains don't hit the
+        recursion limit
         Layer 0: nodes with no parents (source nodes)
         Layer N: max(parent_layer) + 1
-        """
-        layers = {}
 
-        # Topological sort to ensure we process nodes in correct order
-        visited = set()
-        in_degree = {n_id: len(self.reverse_adjacency.get(n_id, [])) for n_id in node_ids}
-
-        def calculate_layer(node_id: str) -> int:
-            """Calculate layer for a node"""
-            if node_id in layers:
-                return layers[node_id]
-
-            # Get parent nodes
-            parents = [p for p in self.reverse_adjacency.get(node_id, []) if p in node_ids]
-
-            if not parents:
-                # No parents = layer 0
-                layers[node_id] = 0
-            else:
-                # Layer = max(parent layers) + 1
-                parent_layers = [calculate_layer(p) for p in parents]
-                layers[node_id] = max(parent_layers) + 1
-
-            return layers[node_id]
+        Nodes are added in the order they are finished (parents before
+        children, starting from each node in input order); the within-layer
+        order of unexecuted nodes follows it.
+        """
+        node_set = set(node_ids)
+        parents = {
+            n_id: [p for p in self.reverse_adjacency.get(n_id, []) if p in node_set]
+            for n_id in node_ids
+        }
 
-        # Calculate layers for all nodes
-        for node_id in node_ids:
-            if node_id not in layers:
-                calculate_layer(node_id)
+        layers = {}
+        started = set()
+        for root in node_ids:
+            if root in started:
+                continue
+            started.add(root)
+            stack = [(root, iter(parents[root]))]
+            while stack:
+                node_id, pending = stack[-1]
+                for parent in pending:
+                    if parent not in started:
+                        started.add(parent)
+                        stack.append((parent, iter(parents[parent])))
+                        break
+                else:
+                    stack.pop()
+                    # Parents still on the stack close a cycle; they are skipped
+                    layers[node_id] = 1 + max(
+                        (layers[p] for p in parents[node_id] if p in layers), default=-1
+                    )
 
         return layers
 
@@ -194,20 +229,8 @@ class DAGLayout:
         Sort nodes by first execution time
         Executed nodes first (sorted by first execution time), unexecuted nodes last
         """
-        executed = []
-        unexecuted = []
-
-        for node_id in node_ids:
-            node = self.nodes.get(node_id, {})
-            first_exec_time = node.get('first_execution_time')
-            if first_exec_time:
-                executed.append((first_exec_time, node_id))
-            else:
-                unexecuted.append(node_id)
-
-        # Sort executed by first execution time, then add unexecuted
-        executed.sort(key=lambda x: x[0])
-        return [n_id for _, n_id in executed] + unexecuted
+        # Stable sort: ties (and all unexecuted nodes) keep their input order
+        return sorted(node_ids, key=self.execution_time_keys.__getitem__)
 
     def _apply_special_positioning(
         self,
@@ -234,6 +257,17 @@ class DAGLayout:
             node = self.nodes.get(node_id, {})
             return str(node.get('type', '')).strip().lower() == 'compute'
 
+        # Parents/children restricted to the layered (non-tool) nodes, built once
+        # and shared by both rules instead of being re-filtered per check
+        parents_of = {
+            n_id: [p for p in self.reverse_adjacency.get(n_id, []) if p in layers]
+            for n_id in layers
+        }
+        children_of = {
+            n_id: [c for c in self.adjacency_list.get(n_id, []) if c in layers]
+            for n_id in layers
+        }
+
         # Rule 2 (priority): Non-layer-0 node with single parent and no children
         moved_by_rule2: Set[str] = set()
         for node_id, layer in layers.items():
@@ -243,19 +277,17 @@ class DAGLayout:
                 continue
 
             # Check if has single parent
-            parents = [p for p in self.reverse_adjacency.get(node_id, []) if p in layers]
+            parents = parents_of[node_id]
             if len(parents) != 1:
                 continue
 
             # Check if has no children
-            children = [c for c in self.adjacency_list.get(node_id, []) if c in layers]
-            if children:
+            if children_of[node_id]:
                 continue
 
             # Check if parent has single child (this node)
             parent_id = parents[0]
-            parent_children = [c for c in self.adjacency_list.get(parent_id, []) if c in layers]
-            if len(parent_children) != 1:
+            if len(children_of[parent_id]) != 1:
                 continue
 
             # Move child to parent's right-bottom
@@ -271,8 +303,7 @@ class DAGLayout:
             if is_compute(node_id):
                 continue
             # Get direct children of this node
-            children = self.adjacency_list.get(node_id, [])
-            children = [c for c in children if c in layers]
+            children = children_of[node_id]
 
             if len(children) == 1:
                 child_id = children[0]
@@ -295,19 +326,17 @@ class DAGLayout:
                 continue
 
             # Check if has single parent
-            parents = [p for p in self.reverse_adjacency.get(node_id, []) if p in layers]
+            parents = parents_of[node_id]
             if len(parents) != 1:
                 continue
 
             # Check if has no children
-            children = [c for c in self.adjacency_list.get(node_id, []) if c in layers]
-            if children:
+            if children_of[node_id]:
                 continue
 
             # Check if parent has multiple children - if so, DON'T apply special positioning
             parent_id = parents[0]
-            parent_children = [c for c in self.adjacency_list.get(parent_id, []) if c in layers]
-            if len(parent_children) > 1:
+            if len(children_of[parent_id]) > 1:
                 continue
 
             # Only apply if parent has single child (this node)
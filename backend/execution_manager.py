@@ -11,7 +11,10 @@ Handles:
 - Execution progress tracking
 """
 
+import hashlib
 import json
+import math
+from collections import Counter, OrderedDict, deque
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
@@ -21,8 +24,8 @@ from project_manager import ProjectManager
 from node_types import get_node_type, NodeMetadata, NodeOutput
 
 
-class ExecutionStatus(Enum):
-    """Execution status enumeration"""
+class ExecutionStatus(str, Enum):
+    """Execution status enumeration (members compare equal to their string values)"""
     PENDING = "pending"
     RUNNING = "running"
     SUCCESS = "success"
@@ -99,6 +102,9 @@ class NodeExecution:
 class ExecutionManager:
     """Manages node execution with dependency resolution"""
 
+    # Number of node results kept in memory (least recently used evicted first)
+    RESULT_MEMO_SIZE = 16
+
     def __init__(self, kernel_manager: KernelManager, project_manager: ProjectManager):
         """
         Initialize ExecutionManager
@@ -109,6 +115,55 @@ class ExecutionManager:
         """
         self.kernel_manager = kernel_manager
         self.project_manager = project_manager
+        # (project_id, node_id) -> (signature of the code and upstream signatures, result)
+        # of its last successful run in this process
+        self._result_memo: "OrderedDict[Tuple[str, str], Tuple[str, Any]]" = OrderedDict()
+
+    def _get_node_code(self, node_id: str) -> Optional[str]:
+        """
+        Get the source of a node's code cell from the project notebook
+
+        Args:
+            node_id: Node identifier
+
+        Returns:
+            Cell source, or None if the notebook has no code cell for the node
+        """
+        notebook_manager = self.project_manager.notebook_manager
+        if notebook_manager is None:
+            return None
+
+        for cell in notebook_manager.find_cells_by_node_id(node_id):
+            # Result display cells share the node_id but aren't the node's code
+            if not cell["metadata"].get("result_cell"):
+                source = cell.get("source", "")
+                return "".join(source) if isinstance(source, list) else source
+        return None
+
+    def _compute_signature(self, project_id: str, code: str, depends_on: List[str]) -> str:
+        """
+        Compute the memoization signature of a node
+
+        Args:
+            project_id: Project identifier
+            code: Node source code
+            depends_on: Upstream node IDs
+
+        Returns:
+            Hex digest of the code combined with the upstream signatures
+        """
+        parts = [code]
+        for dep in depends_on:
+            memo = self._result_memo.get((project_id, dep))
+            parts.append(memo[0] if memo is not None else "")
+        return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _remember_result(self, key: Tuple[str, str], signature: str, result: Any) -> None:
+        """Store a node result in the memo, evicting the least recently used entries"""
+        self._result_memo[key] = (signature, result)
+        self._result_memo.move_to_end(key)
+        while len(self._result_memo) > self.RESULT_MEMO_SIZE:
+            self._result_memo.popitem(last=False)
 
     def get_dependency_order(self, project_id: str) -> List[str]:
         """
@@ -138,11 +193,11 @@ class ExecutionManager:
                     in_degree[node_id] += 1
 
         # Topological sort using Kahn's algorithm
-        queue = [node_id for node_id in node_dict if in_degree[node_id] == 0]
+        queue = deque(node_id for node_id in node_dict if in_degree[node_id] == 0)
         result = []
 
         while queue:
-            node_id = queue.pop(0)
+            node_id = queue.popleft()
             result.append(node_id)
 
             for neighbor in graph[node_id]:
@@ -182,22 +237,38 @@ class ExecutionManager:
         execution = NodeExecution(node_id, node['type'])
         execution.start()
 
+        key = (project_id, node_id)
+        code = self._get_node_code(node_id)
+        signature = None if code is None else self._compute_signature(
+            project_id, code, node.get('depends_on', [])
+        )
+
         # If node is already validated and we can skip, try loading from cache first
         if skip_existing and node.get('execution_status') == 'validated':
+            # Reuse the in-memory result when the code and upstream results are unchanged
+            # since the last successful run in this process. Tool nodes always reload.
+            memo = self._result_memo.get(key)
+            if node['type'] != 'tool' and memo is not None and memo[0] == signature:
+                self._result_memo.move_to_end(key)
+                execution.skip()
+                execution.result = memo[1]
+                return execution
+
             try:
                 # This applies to data_source, compute, and tool nodes
                 result = self.project_manager.load_node_result(project_id, node_id)
                 execution.skip()
                 execution.result = result
                 execution.end_time = datetime.now()
+                if signature is not None:
+                    self._remember_result(key, signature, result)
                 return execution
             except FileNotFoundError:
                 # If pkl/parquet is missing for a validated node, re-execute to regenerate
                 pass
 
-        # Get node code from notebook
-        notebook_path = self.project_manager.get_notebook_path(project_id)
-        code = self.project_manager.notebook_manager.get_node_code(notebook_path, node_id)
+        # Any memoized result is stale once the node runs again
+        self._result_memo.pop(key, None)
 
         if code is None:
             execution.complete(error=f"Node code not found for {node_id}")
@@ -230,6 +301,7 @@ class ExecutionManager:
                 execution.complete(result=var_value)
                 # After successful execution and saving, update the status in project.json
                 self.project_manager.update_node_status(node_id, 'validated', result_path=saved_path)
+                self._remember_result(key, signature, var_value)
             except Exception as e:
                 # Log the error for debugging purposes
                 import logging
@@ -426,17 +498,14 @@ class ExecutionManager:
         Returns:
             Summary dict with stats and results
         """
-        total = len(executions)
-        success = sum(1 for e in executions.values() if e.status == ExecutionStatus.SUCCESS)
-        error = sum(1 for e in executions.values() if e.status == ExecutionStatus.ERROR)
-        skipped = sum(1 for e in executions.values() if e.status == ExecutionStatus.SKIPPED)
-        total_duration = sum(e.duration_seconds for e in executions.values())
+        statuses = Counter(e.status for e in executions.values())
+        total_duration = math.fsum(e.duration_seconds for e in executions.values())
 
         return {
-            "total_nodes": total,
-            "success": success,
-            "error": error,
-            "skipped": skipped,
+            "total_nodes": len(executions),
+            "success": statuses[ExecutionStatus.SUCCESS],
+            "error": statuses[ExecutionStatus.ERROR],
+            "skipped": statuses[ExecutionStatus.SKIPPED],
             "total_duration_seconds": total_duration,
             "executions": {node_id: execution.to_dict() for node_id, execution in executions.items()}
         }
@@ -11,6 +11,7 @@ Handles incremental operations on .ipynb files:
 - Generate result cells from parquet files
 """
 
+import functools
 import json
 import os
 import re
@@ -20,6 +21,9 @@ from pathlib import Path
 from enum import Enum
 
 
+_METADATA_END_MARKER = "# ===== End of system-managed metadata =====\n"
+
+
 class ExecutionStatus(Enum):
     """Cell execution status enumeration"""
     NOT_EXECUTED = "not_executed"
@@ -827,27 +831,25 @@ else:
         }
 
     @staticmethod
+    @functools.lru_cache(maxsize=2048)
     def _extract_code_after_metadata(source_text: str) -> str:
         """
         Extract actual code after system-managed metadata section
 
+        Results are cached by source text since the same cells are re-synced
+        on every execution.
+
         Args:
             source_text: Full source code text
 
         Returns:
             Code without metadata comments (preserves empty lines)
         """
-        # Find the end marker - must include the newline after it
-        # Pattern explanation:
-        # - #\s*===== End of system-managed metadata ===== : matches the end marker with optional whitespace
-        # - \n : matches the newline after the marker
-        # - (.*) : captures everything after, including the first newline
-        pattern = r"#\s*===== End of system-managed metadata =====\n(.*)"
-        match = re.search(pattern, source_text, re.DOTALL)
-        if match:
-            extracted = match.group(1)
-            # Ensure we preserve the code, even if it starts with whitespace
-            return extracted
+        # Split after the last end marker (including its newline) so that header
+        # blocks duplicated by earlier syncs are stripped as well
+        _, marker, code = source_text.rpartition(_METADATA_END_MARKER)
+        if marker:
+            return code
         # If no metadata section, return original text
         return source_text
 
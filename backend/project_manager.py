@@ -19,6 +19,13 @@ from typing import Any, Dict, List, Optional
 
 from notebook_manager import NotebookManager
 
+# Keys accepted in ProjectManager.add_nodes() specs (the add_node() arguments)
+_NODE_SPEC_REQUIRED_KEYS = ("node_id", "node_type", "name")
+_NODE_SPEC_KEYS = frozenset(_NODE_SPEC_REQUIRED_KEYS + (
+    "depends_on", "code", "node_description", "execution_status",
+    "result_format", "result_path", "position",
+))
+
 
 class ProjectMetadata:
     """Project metadata configuration with execution tracking"""
@@ -242,6 +249,40 @@ class ProjectManager:
 
         Returns:
             Index of the last added cell in notebook
+
+        Raises:
+            ValueError: If node_id already exists in the project
+        """
+        return self.add_nodes([{
+            "node_id": node_id,
+            "node_type": node_type,
+            "name": name,
+            "depends_on": depends_on,
+            "code": code,
+            "node_description": node_description,
+            "execution_status": execution_status,
+            "result_format": result_format,
+            "result_path": result_path,
+            "position": position
+        }])[-1]
+
+    def add_nodes(self, specs: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several nodes to the project, writing notebook and metadata once
+
+        Each spec is a dict with the same keys as the add_node() arguments
+        (node_id, node_type and name are required). All specs are checked
+        before any node is added, so a bad spec leaves the project untouched.
+
+        Args:
+            specs: List of node specs
+
+        Returns:
+            Index of the last added cell in notebook for each spec
+
+        Raises:
+            ValueError: If a spec is missing a required field, has an unknown key,
+                or reuses a node_id already in the project or the batch
         """
         if not self.loaded:
             raise RuntimeError("Project not loaded")
@@ -249,6 +290,44 @@ class ProjectManager:
         if self.metadata is None or self.notebook_manager is None:
             raise RuntimeError("Project not properly initialized")
 
+        if not specs:
+            return []
+
+        seen_ids = set()
+        for spec in specs:
+            missing = [key for key in _NODE_SPEC_REQUIRED_KEYS if spec.get(key) is None]
+            if missing:
+                raise ValueError(f"Node spec missing required fields: {', '.join(missing)}")
+            unknown = [key for key in spec if key not in _NODE_SPEC_KEYS]
+            if unknown:
+                raise ValueError(f"Node spec has unknown fields: {', '.join(unknown)}")
+            node_id = spec["node_id"]
+            if node_id in self.metadata.nodes or node_id in seen_ids:
+                raise ValueError(f"Node {node_id} already exists")
+            seen_ids.add(node_id)
+
+        cell_indices = [self._insert_node(**spec) for spec in specs]
+
+        # Save changes
+        self.notebook_manager.save()
+        self._save_metadata()
+
+        return cell_indices
+
+    def _insert_node(
+        self,
+        node_id: str,
+        node_type: str,
+        name: str,
+        depends_on: Optional[List[str]] = None,
+        code: str = "",
+        node_description: str = "",
+        execution_status: str = "not_executed",
+        result_format: Optional[str] = None,
+        result_path: Optional[str] = None,
+        position: Optional[Dict[str, float]] = None
+    ) -> int:
+        """Add a node to metadata and notebook in memory without saving"""
         # Add to metadata
         self.metadata.add_node(
             node_id, node_type, name, depends_on,
@@ -285,10 +364,6 @@ class ProjectManager:
                 description=f"Result for {name}"
             )
 
-        # Save changes
-        self.notebook_manager.save()
-        self._save_metadata()
-
         return cell_index
 
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
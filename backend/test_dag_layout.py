@@ -4,8 +4,14 @@ Test script for DAG layout algorithm
 """
 
 import json
+import logging
 from dag_layout import DAGLayout, calculate_node_positions
 
+LAYER_WIDTH = DAGLayout.LAYER_WIDTH
+SPECIAL_OFFSET = DAGLayout.SPECIAL_OFFSET
+
+log = logging.getLogger(__name__)
+
 
 def test_tool_node_positioning():
     """Test that tool nodes are positioned at the top"""
@@ -29,11 +35,11 @@ def test_tool_node_positioning():
     # Data source node should have positive or zero y
     assert positions['data_1']['y'] >= 0, "Non-tool nodes should have non-negative y"
 
-    print("✓ Tool node positioning test passed")
+    log.debug("✓ Tool node positioning test passed")
 
 
 def test_hierarchical_layering():
-    """Test that nodes are layered correctly (left to right with LAYER_WIDTH=300)"""
+    """Test that nodes are layered correctly (left to right, LAYER_WIDTH apart)"""
     nodes = [
         {'id': 'source', 'type': 'data_source', 'first_execution_time': None},
         {'id': 'compute1', 'type': 'compute', 'first_execution_time': None},
@@ -52,14 +58,14 @@ def test_hierarchical_layering():
     # Source should be in layer 0 (leftmost)
     assert positions['source']['x'] == 0, "Source node should be at x=0"
 
-    # Compute nodes should be in layer 1 (x = 1 * LAYER_WIDTH = 300)
-    assert positions['compute1']['x'] == 300, "Compute nodes should be at layer 1 (x=300)"
-    assert positions['compute2']['x'] == 300, "Compute nodes should be at layer 1 (x=300)"
+    # Compute nodes should be in layer 1 (x = 1 * LAYER_WIDTH)
+    assert positions['compute1']['x'] == LAYER_WIDTH, f"Compute nodes should be at layer 1 (x={LAYER_WIDTH})"
+    assert positions['compute2']['x'] == LAYER_WIDTH, f"Compute nodes should be at layer 1 (x={LAYER_WIDTH})"
 
-    # Chart should be in layer 2 (x = 2 * LAYER_WIDTH = 600)
-    assert positions['chart']['x'] == 600, "Chart node should be at layer 2 (x=600)"
+    # Chart should be in layer 2 (x = 2 * LAYER_WIDTH)
+    assert positions['chart']['x'] == 2 * LAYER_WIDTH, f"Chart node should be at layer 2 (x={2 * LAYER_WIDTH})"
 
-    print("✓ Hierarchical layering test passed")
+    log.debug("✓ Hierarchical layering test passed")
 
 
 def test_execution_time_sorting():
@@ -88,7 +94,7 @@ def test_execution_time_sorting():
     assert y_compute2 < y_compute1, "compute2 should be above compute1 (earlier execution time)"
     assert y_compute1 < y_compute3, "Executed nodes should be above unexecuted"
 
-    print("✓ Execution time sorting test passed")
+    log.debug("✓ Execution time sorting test passed")
 
 
 def test_single_child_positioning():
@@ -101,17 +107,17 @@ def test_single_child_positioning():
 
     positions = calculate_node_positions(nodes, edges)
 
-    # Source should be moved to left-top of compute (SPECIAL_OFFSET = 60)
+    # Source should be moved to left-top of compute by SPECIAL_OFFSET
     compute_x = positions['compute']['x']
     compute_y = positions['compute']['y']
     source_x = positions['source']['x']
     source_y = positions['source']['y']
 
-    # Source should be offset by SPECIAL_OFFSET (60) to the left and up
-    assert source_x == compute_x - 60, f"Source x should be {compute_x - 60}, got {source_x}"
-    assert source_y == compute_y - 60, f"Source y should be {compute_y - 60}, got {source_y}"
+    # Source should be offset by SPECIAL_OFFSET to the left and up
+    assert source_x == compute_x - SPECIAL_OFFSET, f"Source x should be {compute_x - SPECIAL_OFFSET}, got {source_x}"
+    assert source_y == compute_y - SPECIAL_OFFSET, f"Source y should be {compute_y - SPECIAL_OFFSET}, got {source_y}"
 
-    print("✓ Single child positioning test passed")
+    log.debug("✓ Single child positioning test passed")
 
 
 def test_single_parent_positioning():
@@ -128,20 +134,42 @@ def test_single_parent_positioning():
 
     positions = calculate_node_positions(nodes, edges)
 
-    # Chart should be positioned to the right-bottom of compute2 (SPECIAL_OFFSET = 60)
+    # Chart should be positioned to the right-bottom of compute2 by SPECIAL_OFFSET
     compute2_x = positions['compute2']['x']
     compute2_y = positions['compute2']['y']
     chart_x = positions['chart']['x']
     chart_y = positions['chart']['y']
 
-    # Chart should be offset by SPECIAL_OFFSET (60) to the right and down
-    assert chart_x == compute2_x + 60, f"Chart x should be {compute2_x + 60}, got {chart_x}"
-    assert chart_y == compute2_y + 60, f"Chart y should be {compute2_y + 60}, got {chart_y}"
+    # Chart should be offset by SPECIAL_OFFSET to the right and down
+    assert chart_x == compute2_x + SPECIAL_OFFSET, f"Chart x should be {compute2_x + SPECIAL_OFFSET}, got {chart_x}"
+    assert chart_y == compute2_y + SPECIAL_OFFSET, f"Chart y should be {compute2_y + SPECIAL_OFFSET}, got {chart_y}"
+
+    log.debug("✓ Single parent positioning test passed")
+
+
+def test_deep_chain_layering():
+    """Test that long dependency chains are layered without recursion limits"""
+    chain_length = 5000
+    # Listed leaf-first so each node's ancestors have not been layered yet
+    nodes = [
+        {'id': f'compute{i}', 'type': 'compute', 'first_execution_time': None}
+        for i in reversed(range(chain_length))
+    ]
+    edges = [(f'compute{i}', f'compute{i + 1}') for i in range(chain_length - 1)]
+
+    positions = calculate_node_positions(nodes, edges)
+
+    # Each node sits one layer to the right of its parent
+    # (the leaf is left out since it is moved by the single-parent rule)
+    assert positions['compute0']['x'] == 0
+    middle = chain_length // 2
+    assert positions[f'compute{middle}']['x'] == middle * LAYER_WIDTH
 
-    print("✓ Single parent positioning test passed")
+    log.debug("✓ Deep chain layering test passed")
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
     print("Testing DAG layout algorithm...\n")
 
     try:
@@ -150,6 +178,7 @@ if __name__ == '__main__':
         test_execution_time_sorting()
         test_single_child_positioning()
         test_single_parent_positioning()
+        test_deep_chain_layering()
 
         print("\n✅ All tests passed!")
     except AssertionError as e:
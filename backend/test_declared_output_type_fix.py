@@ -7,16 +7,19 @@ subsequent nodes without the declaration are NOT incorrectly treated as dicts.
 """
 
 import json
+import logging
 import tempfile
 from pathlib import Path
 import pandas as pd
 
+log = logging.getLogger(__name__)
+
 def test_declared_output_type_logic():
     """Test the corrected logic for determining is_dict_result"""
 
-    print("Testing declared_output_type handling...\n")
+    log.debug("Testing declared_output_type handling...\n")
 
-    # Simulate the code logic from code_executor.py lines 1595-1651
+    # Simulate the dict-result decision from CodeExecutor (declared type first, then auto-detect)
     test_cases = [
         {
             "node_id": "node_a",
@@ -63,7 +66,7 @@ def test_declared_output_type_logic():
         declared_output_type = test_case["declared_output_type"]
         result_format = test_case["result_format"]
 
-        # FIXED LOGIC (from code_executor.py lines 1595-1651)
+        # FIXED LOGIC (mirrors CodeExecutor: a declared type is trusted, no auto-detect)
         is_dict_result = False
         need_auto_detect = False
 
@@ -96,12 +99,12 @@ def test_declared_output_type_logic():
         assert result_path.endswith(test_case["expected_result_path_suffix"]), \
             f"✗ {test_case['name']}: Expected result_path to end with '{test_case['expected_result_path_suffix']}', got '{result_path}'"
 
-        print(f"✓ {test_case['name']}")
-        print(f"  is_dict_result: {is_dict_result} (expected: {test_case['expected_is_dict_result']})")
-        print(f"  result_path: {result_path} (expected to end with: {test_case['expected_result_path_suffix']})")
-        print()
+        log.debug("✓ %s", test_case['name'])
+        log.debug("  is_dict_result: %s (expected: %s)", is_dict_result, test_case['expected_is_dict_result'])
+        log.debug("  result_path: %s (expected to end with: %s)", result_path, test_case['expected_result_path_suffix'])
 
-    print("✅ All declared_output_type tests passed!")
+    log.debug("✅ All declared_output_type tests passed!")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
     test_declared_output_type_logic()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test script for ExecutionManager.execute_node skip/cache handling
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+
+from execution_manager import ExecutionManager, ExecutionStatus
+from notebook_manager import NotebookManager
+
+log = logging.getLogger(__name__)
+
+
+class FakeKernelManager:
+    """Kernel double: every run succeeds and each node variable is '<node_id>-value'"""
+
+    def __init__(self):
+        self.executed = []
+
+    def execute_code(self, project_id, code, timeout=30):
+        self.executed.append((project_id, code))
+        return {'status': 'ok', 'output': '', 'error': None}
+
+    def get_variable(self, project_id, name):
+        return f"{name}-value"
+
+
+class FakeProjectManager:
+    """Project double backed by a real NotebookManager and in-memory node metadata"""
+
+    def __init__(self, notebook_path):
+        self.notebook_manager = NotebookManager(str(notebook_path))
+        self.nodes = {}
+        self.loads = []
+        self.fail_status_update = False
+
+    def add(self, node_id, code, execution_status='not_executed', node_type='compute'):
+        self.nodes[node_id] = {
+            'node_id': node_id,
+            'type': node_type,
+            'depends_on': [],
+            'execution_status': execution_status,
+        }
+        self.notebook_manager.append_code_cell(code, node_type=node_type, node_id=node_id)
+
+    def get_node(self, node_id):
+        return self.nodes.get(node_id)
+
+    def load_node_result(self, project_id, node_id):
+        self.loads.append((project_id, node_id))
+        return f"{node_id}-cached"
+
+    def save_node_result(self, project_id, node_id, value, node_type=None, is_visualization=False):
+        return f"parquets/{node_id}.parquet"
+
+    def update_node_status(self, node_id, status, result_path=None, error=None):
+        if self.fail_status_update and status == 'validated':
+            raise IOError("project.json is read-only")
+        self.nodes[node_id]['execution_status'] = status
+
+
+def _make_manager(tmp_dir):
+    pm = FakeProjectManager(Path(tmp_dir) / "project.ipynb")
+    km = FakeKernelManager()
+    return ExecutionManager(km, pm), pm, km
+
+
+def test_validated_node_loads_cached_result():
+    """A validated node is skipped and returns its saved result without running code"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager, pm, km = _make_manager(tmp_dir)
+        pm.add('data_1', "data_1 = 1", execution_status='validated')
+
+        execution = manager.execute_node('proj', 'data_1')
+
+        assert execution.status == ExecutionStatus.SKIPPED
+        assert execution.result == 'data_1-cached'
+        assert km.executed == [], "Validated node should not be executed"
+
+    log.debug("✓ Validated node cache test passed")
+
+
+def test_unvalidated_node_runs_notebook_code():
+    """An unvalidated node runs its notebook cell and is marked validated"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager, pm, km = _make_manager(tmp_dir)
+        pm.add('compute_1', "compute_1 = 2")
+
+        execution = manager.execute_node('proj', 'compute_1')
+
+        assert execution.status == ExecutionStatus.SUCCESS, execution.error
+        assert execution.result == 'compute_1-value'
+        assert len(km.executed) == 1 and "compute_1 = 2" in km.executed[0][1]
+        assert pm.nodes['compute_1']['execution_status'] == 'validated'
+
+    log.debug("✓ Unvalidated node execution test passed")
+
+
+def test_result_memo():
+    """Memoized results are served only for validated nodes of the same project"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager, pm, km = _make_manager(tmp_dir)
+        pm.add('compute_1', "compute_1 = 2")
+        manager.execute_node('proj', 'compute_1')
+
+        # Rerun after a successful execution: served from memory, not from disk
+        execution = manager.execute_node('proj', 'compute_1')
+        assert execution.status == ExecutionStatus.SKIPPED
+        assert execution.result == 'compute_1-value'
+        assert pm.loads == []
+
+        # Same node id in another project does not share the memo
+        execution = manager.execute_node('other', 'compute_1')
+        assert execution.result == 'compute_1-cached'
+
+        # A node reset to pending runs again
+        pm.nodes['compute_1']['execution_status'] = 'pending_validation'
+        manager.execute_node('proj', 'compute_1')
+        assert len(km.executed) == 2
+
+        # A failed status update is not memoized
+        pm.nodes['compute_1']['execution_status'] = 'not_executed'
+        pm.fail_status_update = True
+        execution = manager.execute_node('proj', 'compute_1')
+        assert execution.status == ExecutionStatus.ERROR
+        pm.fail_status_update = False
+        pm.nodes['compute_1']['execution_status'] = 'validated'
+        execution = manager.execute_node('proj', 'compute_1')
+        assert execution.result == 'compute_1-cached', "Failed run should not be memoized"
+
+    log.debug("✓ Result memo test passed")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+    print("Testing ExecutionManager...\n")
+
+    try:
+        test_validated_node_loads_cached_result()
+        test_unvalidated_node_runs_notebook_code()
+        test_result_memo()
+
+        print("\n✅ All tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
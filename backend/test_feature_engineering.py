@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script for the feature engineering toolkit's normalize operation
+"""
+
+import logging
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from toolkits.data_analysis.feature_engineering import feature_engineering
+
+log = logging.getLogger(__name__)
+
+
+def test_normalize_nullable_column():
+    """Nullable integer columns come back as nullable floats with pd.NA kept"""
+    df = pd.DataFrame({'count': pd.array([1, None, 3, 2], dtype='Int64')})
+
+    result = feature_engineering(df, operation='normalize')
+
+    assert str(result['count'].dtype) == 'Float64', f"Expected Float64, got {result['count'].dtype}"
+    assert result['count'][1] is pd.NA, "Missing values should stay pd.NA"
+    assert result['count'][0] == 0.0 and result['count'][2] == 1.0
+    assert result['count'][3] == 0.5
+
+    log.debug("✓ Nullable column normalize test passed")
+
+
+def test_normalize_all_nan_column():
+    """All-NaN columns stay NaN without emitting warnings"""
+    df = pd.DataFrame({'empty': [np.nan, np.nan, np.nan], 'value': [1.0, 3.0, 2.0]})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = feature_engineering(df, operation='normalize')
+
+    assert result['empty'].isna().all(), "All-NaN column should stay NaN"
+    assert result['value'].tolist() == [0.0, 1.0, 0.5]
+
+    log.debug("✓ All-NaN column normalize test passed")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+    print("Testing feature engineering toolkit...\n")
+
+    try:
+        test_normalize_nullable_column()
+        test_normalize_all_nan_column()
+
+        print("\n✅ All tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for ProjectManager.add_nodes
+"""
+
+import logging
+import tempfile
+
+from project_manager import ProjectManager
+
+log = logging.getLogger(__name__)
+
+
+def _create_project(tmp_dir):
+    pm = ProjectManager(tmp_dir, "test_project")
+    pm.create("Test Project")
+    return pm
+
+
+def _snapshot(pm):
+    """Node ids, cell count and saved notebook bytes, to check nothing changed"""
+    return (
+        list(pm.metadata.nodes),
+        pm.notebook_manager.get_cell_count(),
+        pm.notebook_path.read_bytes(),
+    )
+
+
+def test_add_nodes():
+    """Nodes are added in order with one cell index returned per spec"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pm = _create_project(tmp_dir)
+
+        indices = pm.add_nodes([
+            {"node_id": "data_1", "node_type": "data_source", "name": "Data", "code": "data_1 = 1"},
+            {"node_id": "compute_1", "node_type": "compute", "name": "", "depends_on": ["data_1"],
+             "code": "compute_1 = data_1", "node_description": "Doubles the data"},
+        ])
+
+        assert list(pm.metadata.nodes) == ["data_1", "compute_1"]
+        assert pm.metadata.nodes["compute_1"]["name"] == "", "Empty names are allowed"
+        assert len(indices) == 2 and indices[0] < indices[1]
+        assert pm.notebook_manager.get_cell(indices[1])["metadata"]["node_id"] == "compute_1"
+
+        # Both files were written
+        reloaded = ProjectManager(tmp_dir, "test_project")
+        reloaded.load()
+        assert list(reloaded.metadata.nodes) == ["data_1", "compute_1"]
+        assert len(reloaded.notebook_manager.find_cells_by_node_id("compute_1")) == 1
+
+        assert pm.add_nodes([]) == []
+
+    log.debug("✓ add_nodes test passed")
+
+
+def test_add_nodes_unknown_key():
+    """A spec with an unknown key is rejected before any node is added"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pm = _create_project(tmp_dir)
+        before = _snapshot(pm)
+
+        try:
+            pm.add_nodes([
+                {"node_id": "data_1", "node_type": "data_source", "name": "Data"},
+                {"node_id": "data_2", "node_type": "data_source", "name": "Data", "colour": "red"},
+            ])
+        except ValueError as e:
+            assert "colour" in str(e)
+        else:
+            raise AssertionError("Unknown spec key should raise ValueError")
+
+        assert _snapshot(pm) == before, "Project should be untouched"
+
+    log.debug("✓ add_nodes unknown key test passed")
+
+
+def test_add_nodes_duplicate_id():
+    """Node ids already in the project or repeated in the batch are rejected"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pm = _create_project(tmp_dir)
+        pm.add_node("data_1", "data_source", "Data")
+        before = _snapshot(pm)
+
+        for specs in (
+            [{"node_id": "data_1", "node_type": "data_source", "name": "Again"}],
+            [{"node_id": "data_2", "node_type": "data_source", "name": "Data"},
+             {"node_id": "data_2", "node_type": "compute", "name": "Twice"}],
+        ):
+            try:
+                pm.add_nodes(specs)
+            except ValueError as e:
+                assert "already exists" in str(e)
+            else:
+                raise AssertionError("Duplicate node_id should raise ValueError")
+
+            assert _snapshot(pm) == before, "Project should be untouched"
+
+    log.debug("✓ add_nodes duplicate id test passed")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+    print("Testing ProjectManager.add_nodes...\n")
+
+    try:
+        test_add_nodes()
+        test_add_nodes_unknown_key()
+        test_add_nodes_duplicate_id()
+
+        print("\n✅ All tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        exit(1)
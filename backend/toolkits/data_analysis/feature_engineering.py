@@ -16,12 +16,22 @@ Usage in notebook:
     # Call like: feature_engineering(df, operation='polynomial_features')
 """
 
+import warnings
+
+import numpy as np
 import pandas as pd
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_timedelta64_dtype
+
+
+# Age bins for _create_bins: right-closed intervals (0, 30], (30, 50], (50, 100]
+_AGE_BINS = np.array([0, 30, 50, 100], dtype=np.float64)
+_AGE_DTYPE = pd.CategoricalDtype(['young', 'middle', 'senior'], ordered=True)
 
 
 # ============ Helper Functions ============
 
-def _polynomial_features(df: pd.DataFrame) -> pd.DataFrame:
+def _polynomial_features(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
     """
     Create polynomial features from numeric columns
 
@@ -29,19 +39,26 @@ def _polynomial_features(df: pd.DataFrame) -> pd.DataFrame:
         df: Input DataFrame
 
     Returns:
-        DataFrame with polynomial features added
+        DataFrame with polynomial features added (the input itself if it has
+        no 'age' column, so don't mutate the result in place)
     """
+    # Nothing to add: hand back the input without copying
+    if 'age' not in df.columns:
+        return df
+
     df_copy = df.copy()
 
     # Example: create squared age feature
-    if 'age' in df_copy.columns:
-        df_copy['age_squared'] = df_copy['age'] ** 2
-        df_copy['age_cubed'] = df_copy['age'] ** 3
+    # Plain multiplies on the underlying array, reusing the square for the cube
+    age = df_copy['age'].values
+    age_squared = age * age
+    df_copy['age_squared'] = age_squared
+    df_copy['age_cubed'] = age_squared * age
 
     return df_copy
 
 
-def _create_bins(df: pd.DataFrame) -> pd.DataFrame:
+def _create_bins(df: pd.DataFrame, **kwargs) -> pd.DataFrame:
     """
     Create binned/categorical versions of numeric columns
 
@@ -53,18 +70,19 @@ def _create_bins(df: pd.DataFrame) -> pd.DataFrame:
     """
     df_copy = df.copy()
 
-    # Example: bin age into groups
+    # Example: bin age into groups (same result as pd.cut with these bins/labels,
+    # using a binary search over the edges and a dtype built once at import)
     if 'age' in df_copy.columns:
-        df_copy['age_group'] = pd.cut(
-            df_copy['age'],
-            bins=[0, 30, 50, 100],
-            labels=['young', 'middle', 'senior']
-        )
+        age = df_copy['age'].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes = np.searchsorted(_AGE_BINS, age, side='left') - 1
+        # Out-of-range and NaN ages get no bin, like pd.cut
+        codes[(codes < 0) | (codes >= len(_AGE_DTYPE.categories)) | np.isnan(age)] = -1
+        df_copy['age_group'] = pd.Categorical.from_codes(codes, dtype=_AGE_DTYPE)
 
     return df_copy
 
 
-def _normalize(df: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+def _normalize(df: pd.DataFrame, columns: list = None, **kwargs) -> pd.DataFrame:
     """
     Normalize numeric columns to 0-1 range
 
@@ -78,17 +96,62 @@ def _normalize(df: pd.DataFrame, columns: list = None) -> pd.DataFrame:
     df_copy = df.copy()
 
     if columns is None:
-        columns = df_copy.select_dtypes(include=['number']).columns
-
-    for col in columns:
-        if col in df_copy.columns:
-            min_val = df_copy[col].min()
-            max_val = df_copy[col].max()
-            df_copy[col] = (df_copy[col] - min_val) / (max_val - min_val)
+        # Same selection as select_dtypes(include='number') without building a
+        # sub-frame: numeric and timedelta columns, but not booleans
+        columns = [
+            col for col, dtype in df_copy.dtypes.items()
+            if (is_numeric_dtype(dtype) and not is_bool_dtype(dtype))
+            or is_timedelta64_dtype(dtype)
+        ]
+
+    cols = [col for col in columns if col in df_copy.columns]
+    if not cols or df_copy.empty:
+        return df_copy
+
+    # Normalize all selected columns in one broadcasted pass (NaNs are ignored
+    # for min/max like pandas does); constant columns map to 0 instead of NaN.
+    # The array is a private float64 copy, so it is normalized in place
+    # without allocating temporaries. Timedeltas enter as nanosecond counts
+    # (NaT -> NaN) and come out as floats, as (td - min) / (max - min) did.
+    sub = np.empty((len(df_copy), len(cols)), dtype=np.float64, order='F')
+    # Nullable (masked) numeric columns come back as nullable floats with pd.NA,
+    # like the per-column arithmetic gave: index -> output dtype
+    masked = {}
+    for j, col in enumerate(cols):
+        values = df_copy[col]
+        dtype = values.dtype
+        if is_timedelta64_dtype(dtype):
+            values = values / pd.Timedelta(1, unit='ns')
+        elif isinstance(dtype, ExtensionDtype) and dtype.kind in 'iuf':
+            masked[j] = dtype if dtype.kind == 'f' else 'Float64'
+        sub[:, j] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # All-NaN columns stay NaN; don't warn about their empty min/max
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mn = np.nanmin(sub, axis=0)
+        mx = np.nanmax(sub, axis=0)
+    rng = np.where(mx == mn, 1.0, mx - mn)
+    sub -= mn
+    sub /= rng
+
+    for j, col in enumerate(cols):
+        if j in masked:
+            df_copy[col] = pd.array(sub[:, j], dtype=masked[j])
+        else:
+            df_copy[col] = sub[:, j]
 
     return df_copy
 
 
+# Operation name -> helper; helpers take (df, **kwargs) and ignore unused kwargs
+_OPS = {
+    'polynomial_features': _polynomial_features,
+    'create_bins': _create_bins,
+    'normalize': _normalize,
+}
+
+
 # ============ Entry Function (REQUIRED) ============
 
 def feature_engineering(df: pd.DataFrame, operation: str = 'polynomial_features', **kwargs):
@@ -119,18 +182,10 @@ def feature_engineering(df: pd.DataFrame, operation: str = 'polynomial_features'
         >>> result = feature_engineering(df, operation='create_bins')
         >>> result = feature_engineering(df, operation='normalize', columns=['age', 'income'])
     """
-    if operation == 'polynomial_features':
-        return _polynomial_features(df)
-
-    elif operation == 'create_bins':
-        return _create_bins(df)
-
-    elif operation == 'normalize':
-        columns = kwargs.get('columns', None)
-        return _normalize(df, columns=columns)
-
-    else:
+    fn = _OPS.get(operation)
+    if fn is None:
         raise ValueError(
             f"Unknown operation: {operation}\n"
-            f"Available operations: polynomial_features, create_bins, normalize"
+            f"Available operations: {', '.join(_OPS)}"
         )
+    return fn(df, **kwargs)
@@ -6,9 +6,16 @@
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
+_PROJECT_DIR = Path(__file__).resolve().parent
+_PROJECT_JSON = _PROJECT_DIR / "project.json"
+_PARQUETS_DIR = _PROJECT_DIR / "parquets"
+_DICT_DIR = _PARQUETS_DIR / "create_dict"
+_METADATA_FILE = _DICT_DIR / "_metadata.json"
+
 def print_header(text):
     """打印分隔符和标题"""
     print(f"\n{'='*60}")
@@ -25,25 +32,18 @@ def print_status(check_name, passed, details=""):
 def verify_project():
     """验证整个执行流程"""
 
-    project_dir = Path(__file__).parent
-    project_json = project_dir / "project.json"
-    parquets_dir = project_dir / "parquets"
-    dict_dir = parquets_dir / "create_dict"
-    metadata_file = dict_dir / "_metadata.json"
-
-    results = []
+    # 失败原因在检查时即时记录，总结时不再重复检测
+    failures = []
 
     # ==================== 检查1: project.json存在且有效 ====================
     print_header("检查1: project.json 有效性")
 
-    if not project_json.exists():
-        print_status("project.json 存在", False)
-        return False
-
     try:
-        with open(project_json) as f:
-            data = json.load(f)
+        data = json.loads(_PROJECT_JSON.read_bytes())
         print_status("project.json 可解析", True)
+    except FileNotFoundError:
+        print_status("project.json 存在", False)
+        return False
     except Exception as e:
         print_status("project.json 可解析", False, str(e))
         return False
@@ -69,15 +69,21 @@ def verify_project():
     result_format = create_dict_node.get("result_format")
     has_result_format = result_format == "parquet"
     print_status("result_format = 'parquet'", has_result_format, f"当前: {result_format}")
+    if not has_result_format:
+        failures.append("result_format 没有保存到project.json")
 
     # 检查result_is_dict
     is_dict = create_dict_node.get("result_is_dict")
-    print_status("result_is_dict = true", is_dict, f"当前: {is_dict}")
+    print_status("result_is_dict = true", is_dict is True, f"当前: {is_dict}")
+    if is_dict is not True:
+        failures.append("result_is_dict 标志不正确")
 
     # 检查result_path
     result_path = create_dict_node.get("result_path")
     correct_path = result_path == "parquets/create_dict"
     print_status("result_path = 'parquets/create_dict'", correct_path, f"当前: {result_path}")
+    if not correct_path:
+        failures.append("result_path 不正确")
 
     if not is_executed:
         print("\n⚠️  节点未执行！请先通过API执行节点")
@@ -86,27 +92,28 @@ def verify_project():
     # ==================== 检查3: 文件系统结构 ====================
     print_header("检查3: 文件系统结构")
 
-    # 检查parquets目录
-    if not parquets_dir.exists():
-        print_status("parquets/ 目录存在", False)
-        return False
-    print_status("parquets/ 目录存在", True)
-
-    # 检查dict子目录
-    if not dict_dir.exists():
+    # 一次scandir同时确认目录存在并拿到各文件大小
+    try:
+        with os.scandir(_DICT_DIR) as it:
+            entries = {e.name: e for e in it}
+    except (FileNotFoundError, NotADirectoryError):
+        # 只在失败时再区分是哪一级目录缺失
+        if not _PARQUETS_DIR.is_dir():
+            print_status("parquets/ 目录存在", False)
+            return False
+        print_status("parquets/ 目录存在", True)
         print_status("parquets/create_dict/ 目录存在", False)
         return False
+    print_status("parquets/ 目录存在", True)
     print_status("parquets/create_dict/ 目录存在", True)
 
     # 检查_metadata.json
-    if not metadata_file.exists():
-        print_status("parquets/create_dict/_metadata.json 文件存在", False)
-        return False
-
     try:
-        with open(metadata_file) as f:
-            metadata = json.load(f)
+        metadata = json.loads(_METADATA_FILE.read_bytes())
         print_status("parquets/create_dict/_metadata.json 有效", True)
+    except FileNotFoundError:
+        print_status("parquets/create_dict/_metadata.json 文件存在", False)
+        return False
     except Exception as e:
         print_status("parquets/create_dict/_metadata.json 有效", False, str(e))
         return False
@@ -116,59 +123,30 @@ def verify_project():
     actual_keys = set(metadata.get("keys", []))
     keys_match = actual_keys == expected_keys
     print_status(f"metadata.keys = {expected_keys}", keys_match, f"实际: {actual_keys}")
+    if not keys_match:
+        failures.append("_metadata.json 的keys不匹配")
 
     # 检查parquet文件
     print("\n检查各个DataFrame的parquet文件:")
     all_parquets_exist = True
     for key in expected_keys:
-        parquet_file = dict_dir / f"{key}.parquet"
-        exists = parquet_file.exists()
+        entry = entries.get(f"{key}.parquet")
+        exists = entry is not None
         all_parquets_exist = all_parquets_exist and exists
 
         if exists:
-            size = parquet_file.stat().st_size
+            size = entry.stat().st_size
             print_status(f"  parquets/create_dict/{key}.parquet", True, f"大小: {size} bytes")
         else:
             print_status(f"  parquets/create_dict/{key}.parquet", False)
 
-    # ==================== 检查4: 元数据完整性 ====================
-    print_header("检查4: 元数据完整性")
-
-    required_fields = {
-        "execution_status": "validated",
-        "result_format": "parquet",
-        "result_is_dict": True,
-        "result_path": "parquets/create_dict"
-    }
-
-    all_fields_ok = True
-    for field, expected_value in required_fields.items():
-        actual_value = create_dict_node.get(field)
-        is_correct = actual_value == expected_value
-        all_fields_ok = all_fields_ok and is_correct
-
-        print_status(
-            f"{field}",
-            is_correct,
-            f"期望: {expected_value}, 实际: {actual_value}"
-        )
+    if not all_parquets_exist:
+        failures.append("parquet文件缺失")
 
     # ==================== 总结 ====================
     print_header("执行流程验证总结")
 
-    all_checks_passed = (
-        is_executed and
-        has_result_format and
-        is_dict and
-        correct_path and
-        dict_dir.exists() and
-        metadata_file.exists() and
-        keys_match and
-        all_parquets_exist and
-        all_fields_ok
-    )
-
-    if all_checks_passed:
+    if not failures:
         print("✅ 所有检查通过！")
         print("\n执行流程正确:")
         print("  1. 节点执行成功")
@@ -185,20 +163,8 @@ def verify_project():
         print("❌ 部分检查失败")
         print("\n需要排查的项目:")
 
-        if not is_executed:
-            print("  - 节点执行状态不是'validated'")
-        if not has_result_format:
-            print("  - result_format 没有保存到project.json")
-        if not is_dict:
-            print("  - result_is_dict 标志不正确")
-        if not correct_path:
-            print("  - result_path 不正确")
-        if not dict_dir.exists():
-            print("  - parquets/create_dict/ 目录不存在")
-        if not all_parquets_exist:
-            print("  - parquet文件缺失")
-        if not keys_match:
-            print("  - _metadata.json 的keys不匹配")
+        for reason in failures:
+            print(f"  - {reason}")
 
         return False
 
@@ -206,30 +172,44 @@ def print_file_structure():
     """打印项目的文件结构"""
     print_header("项目文件结构")
 
-    project_dir = Path(__file__).parent
-    print(f"项目路径: {project_dir}\n")
+    print(f"项目路径: {_PROJECT_DIR}\n")
 
-    def print_tree(path, prefix="", is_last=True):
-        """递归打印目录树"""
-        if not path.exists():
+    def print_tree(root):
+        """用显式栈打印目录树，避免递归和逐项stat"""
+        if not root.is_dir():
             return
 
-        # 打印当前项
-        connector = "└── " if is_last else "├── "
-        print(f"{prefix}{connector}{path.name}")
+        # 栈元素: (名称, 路径, 前缀, 是否最后一项, 是否目录)
+        stack = [(root.name, root, "", True, True)]
+        while stack:
+            name, path, prefix, is_last, is_dir = stack.pop()
 
-        # 如果是目录，递归打印子项
-        if path.is_dir():
-            children = sorted(list(path.iterdir()))
-            # 过滤掉__pycache__等
-            children = [c for c in children if c.name not in {'__pycache__', '.ipynb_checkpoints'}]
+            # 打印当前项
+            connector = "└── " if is_last else "├── "
+            print(f"{prefix}{connector}{name}")
 
-            for i, child in enumerate(children):
-                is_last_child = (i == len(children) - 1)
-                extension = "    " if is_last else "│   "
-                print_tree(child, prefix + extension, is_last_child)
+            # 如果是目录，子项逆序入栈以保持输出顺序
+            if is_dir:
+                with os.scandir(path) as it:
+                    # 过滤掉__pycache__等
+                    children = sorted(
+                        (e for e in it if e.name not in {'__pycache__', '.ipynb_checkpoints'}),
+                        key=lambda e: e.name,
+                    )
 
-    print_tree(project_dir, is_last=True)
+                extension = "    " if is_last else "│   "
+                last_index = len(children) - 1
+                for i in range(last_index, -1, -1):
+                    child = children[i]
+                    stack.append((
+                        child.name,
+                        child.path,
+                        prefix + extension,
+                        i == last_index,
+                        child.is_dir(follow_symlinks=False),
+                    ))
+
+    print_tree(_PROJECT_DIR)
 
 def main():
     """主函数"""